@@ -1,15 +1,22 @@
 """M-Bus Value Information Field Code(s) module."""
 
-from collections.abc import Mapping
-from dataclasses import dataclass
+import sys
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
 from enum import Enum
+from functools import lru_cache
+from math import nan
+from types import MappingProxyType
+from typing import NamedTuple
 
+from pymbus.exceptions import MBusValidationError
 from pymbus.telegrams.fields import (
     ValueInformationField as VIF,
 )
 from pymbus.telegrams.fields import (
     ValueInformationFieldExtension as VIFE,
 )
+from pymbus.utils import validate_byte
 
 
 class VIFCodeKind(str, Enum):
@@ -141,1480 +148,691 @@ class VIFCodeUnit(str, Enum):
     amper = "A"
 
 
-@dataclass
-class VIFCode:
-    """Value Information Code."""
+# the value-to-member lookups bypassing the Enum call machinery
+_VIF_CODE_KINDS: Mapping[str, VIFCodeKind] = MappingProxyType(
+    {member.value: member for member in VIFCodeKind}
+)
+_VIF_CODE_UNITS: Mapping[str, VIFCodeUnit] = MappingProxyType(
+    {member.value: member for member in VIFCodeUnit}
+)
+
+
+def get_kind(value: str) -> None | VIFCodeKind:
+    """Return VIFCodeKind according to `value` string.
+
+    Notes
+    -----
+    A fast alternative to `VIFCodeKind(value)` for the `VIFCode.kind`.
+
+    Parameters
+    ----------
+    value : str
+        a kind of VIF code
+
+    Returns
+    -------
+    None | VIFCodeKind
+        None if there is no such kind
+    """
+    return _VIF_CODE_KINDS.get(value)
+
+
+def get_unit(value: str) -> None | VIFCodeUnit:
+    """Return VIFCodeUnit according to `value` string.
+
+    Notes
+    -----
+    A fast alternative to `VIFCodeUnit(value)` for the `VIFCode.unit`.
+
+    Parameters
+    ----------
+    value : str
+        a unit of VIF code
+
+    Returns
+    -------
+    None | VIFCodeUnit
+        None if there is no such unit
+    """
+    return _VIF_CODE_UNITS.get(value)
+
 
-    coef: int | float = 1
-    kind: str | VIFCodeKind = VIFCodeKind.unknown
-    unit: str | VIFCodeUnit = VIFCodeUnit.unknown
+class VIFCode(NamedTuple):
+    """Value Information Code.
+
+    The instances are immutable and shared between the lookup tables.
+    """
+
+    coef: float = 1.0
+    kind: str = ""  # VIFCodeKind.unknown
+    unit: str = ""  # VIFCodeUnit.unknown
 
 
+# the decimal coefficients shared by the VIF codes
+_POW10: dict[int, float] = {exp: 10.0**exp for exp in range(-12, 8)}
+
 # for optimisation sake
-_reserved_vif_code = VIFCode(kind=VIFCodeKind.reserved)
+_reserved_vif_code = VIFCode(kind=VIFCodeKind.reserved.value)
+
+
+def _decimals(
+    start: int, size: int, exp: int, kind: str, unit: str
+) -> dict[int, VIFCode]:
+    """Return `size` VIF codes of decimal coefficients.
 
+    The code `start + n` gets the `10 ** (exp + n)` coefficient.
+    """
+    return {
+        start + n: VIFCode(coef=_POW10[exp + n], kind=kind, unit=unit)
+        for n in range(size)
+    }
+
+
+# the coefficients of the duration codes: seconds, minutes, hours, days
+_DURATION_COEFS: tuple[float, ...] = (1.0, 60.0, 3600.0, 86400.0)
 
-_VIF_CODE_MAP: dict[int, VIFCode] = {
+
+def _durations(start: int, kind: str) -> dict[int, VIFCode]:
+    """Return 4 VIF codes (E..._..nn) of durations in seconds.
+
+    The code `start + n` gets the `_DURATION_COEFS[n]` coefficient.
+    """
+    return {
+        start + n: VIFCode(coef=coef, kind=kind, unit=VIFCodeUnit.second.value)
+        for n, coef in enumerate(_DURATION_COEFS)
+    }
+
+
+# the main table of VIF codes in code order
+_VIF_CODE_MAP_RAW: dict[int, VIFCode] = {
     # E000_0nnn - Energy (Watt * hour = Wh)
-    0b0000_0000: VIFCode(
-        # code=0x00,
-        coef=1e-3,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
-    ),
-    0b0000_0001: VIFCode(
-        # code=0x01,
-        coef=1e-2,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
-    ),
-    0b0000_0010: VIFCode(
-        # code=0x02,
-        coef=1e-1,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
-    ),
-    0b0000_0011: VIFCode(
-        # code=0x03,
-        coef=1e0,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
-    ),
-    0b0000_0100: VIFCode(
-        # code=0x04,
-        coef=1e1,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
-    ),
-    0b0000_0101: VIFCode(
-        # code=0x05,
-        coef=1e2,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
-    ),
-    0b0000_0110: VIFCode(
-        # code=0x06,
-        coef=1e3,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
-    ),
-    0b0000_0111: VIFCode(
-        # code=0x07,
-        coef=1e4,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.watt_hour,
+    **_decimals(
+        0b0000_0000,
+        8,
+        -3,
+        VIFCodeKind.energy.value,
+        VIFCodeUnit.watt_hour.value,
     ),
     # E000_1nnn - Energy (Joule = J)
-    0b0000_1000: VIFCode(
-        # code=0x08,
-        coef=1e0,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
-    ),
-    0b0000_1001: VIFCode(
-        # code=0x09,
-        coef=1e1,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
-    ),
-    0b0000_1010: VIFCode(
-        # code=0x0A,
-        coef=1e2,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
-    ),
-    0b0000_1011: VIFCode(
-        # code=0x0B,
-        coef=1e3,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
-    ),
-    0b0000_1100: VIFCode(
-        # code=0x0C,
-        coef=1e4,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
-    ),
-    0b0000_1101: VIFCode(
-        # code=0x0D,
-        coef=1e5,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
-    ),
-    0b0000_1110: VIFCode(
-        # code=0x0E,
-        coef=1e6,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
-    ),
-    0b0000_1111: VIFCode(
-        # code=0x0F,
-        coef=1e7,
-        kind=VIFCodeKind.energy,
-        unit=VIFCodeUnit.joule,
+    **_decimals(
+        0b0000_1000, 8, 0, VIFCodeKind.energy.value, VIFCodeUnit.joule.value
     ),
     # E001_0nnn - Volume (Meter cubic = m^3)
-    0b0001_0000: VIFCode(
-        # code=0x10,
-        coef=1e-6,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
-    ),
-    0b0001_0001: VIFCode(
-        # code=0x11,
-        coef=1e-5,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
-    ),
-    0b0001_0010: VIFCode(
-        # code=0x12,
-        coef=1e-4,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
-    ),
-    0b0001_0011: VIFCode(
-        # code=0x13,
-        coef=1e-3,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
-    ),
-    0b0001_0100: VIFCode(
-        # code=0x14,
-        coef=1e-2,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
-    ),
-    0b0001_0101: VIFCode(
-        # code=0x15,
-        coef=1e-1,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
-    ),
-    0b0001_0110: VIFCode(
-        # code=0x16,
-        coef=1e0,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
-    ),
-    0b0001_0111: VIFCode(
-        # code=0x17,
-        coef=1e1,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.meter_cubic,
+    **_decimals(
+        0b0001_0000,
+        8,
+        -6,
+        VIFCodeKind.volume.value,
+        VIFCodeUnit.meter_cubic.value,
     ),
     # E001_1nnn - Mass (Kilogram = kg)
-    0b0001_1000: VIFCode(
-        # code=0x18,
-        coef=1e-3,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
-    ),
-    0b0001_1001: VIFCode(
-        # code=0x19,
-        coef=1e-2,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
-    ),
-    0b0001_1010: VIFCode(
-        # code=0x1A,
-        coef=1e-1,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
-    ),
-    0b0001_1011: VIFCode(
-        # code=0x1B,
-        coef=1e0,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
-    ),
-    0b0001_1100: VIFCode(
-        # code=0x1C,
-        coef=1e1,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
-    ),
-    0b0001_1101: VIFCode(
-        # code=0x1D,
-        coef=1e2,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
-    ),
-    0b0001_1110: VIFCode(
-        # code=0x1E,
-        coef=1e3,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
-    ),
-    0b0001_1111: VIFCode(
-        # code=0x1F,
-        coef=1e4,
-        kind=VIFCodeKind.mass,
-        unit=VIFCodeUnit.kilogram,
+    **_decimals(
+        0b0001_1000, 8, -3, VIFCodeKind.mass.value, VIFCodeUnit.kilogram.value
     ),
     # E010_00nn - On time (in seconds)
-    0b0010_0000: VIFCode(
-        # code=0x20,
-        coef=1,
-        kind=VIFCodeKind.on_time,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0010_0001: VIFCode(
-        # code=0x21,
-        coef=60,
-        kind=VIFCodeKind.on_time,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0010_0010: VIFCode(
-        # code=0x22,
-        coef=3600,
-        kind=VIFCodeKind.on_time,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0010_0011: VIFCode(
-        # code=0x23,
-        coef=86400,
-        kind=VIFCodeKind.on_time,
-        unit=VIFCodeUnit.second,
-    ),
+    **_durations(0b0010_0000, VIFCodeKind.on_time.value),
     # E010_01nn - Operating Time (like On Time)
-    0b0010_0100: VIFCode(
-        # code=0x24,
-        coef=1,
-        kind=VIFCodeKind.operating_time,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0010_0101: VIFCode(
-        # code=0x25,
-        coef=60,
-        kind=VIFCodeKind.operating_time,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0010_0110: VIFCode(
-        # code=0x26,
-        coef=3600,
-        kind=VIFCodeKind.operating_time,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0010_0111: VIFCode(
-        # code=0x27,
-        coef=86400,
-        kind=VIFCodeKind.operating_time,
-        unit=VIFCodeUnit.second,
-    ),
+    **_durations(0b0010_0100, VIFCodeKind.operating_time.value),
     # E010_1nnn - Power (Watt = W)
-    0b0010_1000: VIFCode(
-        # code=0x28,
-        coef=1e-3,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0010_1001: VIFCode(
-        # code=0x29,
-        coef=1e-2,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0010_1010: VIFCode(
-        # code=0x2A,
-        coef=1e-1,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0010_1011: VIFCode(
-        # code=0x2B,
-        coef=1e0,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0010_1100: VIFCode(
-        # code=0x2C,
-        coef=1e1,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0010_1101: VIFCode(
-        # code=0x2D,
-        coef=1e2,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0010_1110: VIFCode(
-        # code=0x2E,
-        coef=1e3,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0010_1111: VIFCode(
-        # code=0x2F,
-        coef=1e4,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.watt,
+    **_decimals(
+        0b0010_1000, 8, -3, VIFCodeKind.power.value, VIFCodeUnit.watt.value
     ),
     # E011_0nnn - Power (Joule per hour = J/h)
-    0b0011_0000: VIFCode(
-        # code=0x30,
-        coef=1e0,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
-    ),
-    0b0011_0001: VIFCode(
-        # code=0x31,
-        coef=1e1,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
-    ),
-    0b0011_0010: VIFCode(
-        # code=0x32,
-        coef=1e2,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
-    ),
-    0b0011_0011: VIFCode(
-        # code=0x33,
-        coef=1e3,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
-    ),
-    0b0011_0100: VIFCode(
-        # code=0x34,
-        coef=1e4,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
-    ),
-    0b0011_0101: VIFCode(
-        # code=0x35,
-        coef=1e5,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
-    ),
-    0b0011_0110: VIFCode(
-        # code=0x36,
-        coef=1e6,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
-    ),
-    0b0011_0111: VIFCode(
-        # code=0x37,
-        coef=1e7,
-        kind=VIFCodeKind.power,
-        unit=VIFCodeUnit.joule_per_hour,
+    **_decimals(
+        0b0011_0000,
+        8,
+        0,
+        VIFCodeKind.power.value,
+        VIFCodeUnit.joule_per_hour.value,
     ),
     # E011_1nnn - Volume flow (Meter cubic per hour = m^3/h)
-    0b0011_1000: VIFCode(
-        # code=0x38,
-        coef=1e-6,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
-    ),
-    0b0011_1001: VIFCode(
-        # code=0x39,
-        coef=1e-5,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
-    ),
-    0b0011_1010: VIFCode(
-        # code=0x3A,
-        coef=1e-4,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
-    ),
-    0b0011_1011: VIFCode(
-        # code=0x3B,
-        coef=1e-3,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
-    ),
-    0b0011_1100: VIFCode(
-        # code=0x3C,
-        coef=1e-2,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
-    ),
-    0b0011_1101: VIFCode(
-        # code=0x3D,
-        coef=1e-1,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
-    ),
-    0b0011_1110: VIFCode(
-        # code=0x3E,
-        coef=1e0,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
-    ),
-    0b0011_1111: VIFCode(
-        # code=0x3F,
-        coef=1e1,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_hour,
+    **_decimals(
+        0b0011_1000,
+        8,
+        -6,
+        VIFCodeKind.volume_flow.value,
+        VIFCodeUnit.meter_cubic_per_hour.value,
     ),
     # E100_0nnn - Volume flow (Meter cubic per minute = m^3/min)
-    0b0100_0000: VIFCode(
-        # code=0x40,
-        coef=1e-7,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
-    ),
-    0b0100_0001: VIFCode(
-        # code=0x41,
-        coef=1e-6,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
-    ),
-    0b0100_0010: VIFCode(
-        # code=0x42,
-        coef=1e-5,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
-    ),
-    0b0100_0011: VIFCode(
-        # code=0x43,
-        coef=1e-4,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
-    ),
-    0b0100_0100: VIFCode(
-        # code=0x44,
-        coef=1e-3,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
-    ),
-    0b0100_0101: VIFCode(
-        # code=0x45,
-        coef=1e-2,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
-    ),
-    0b0100_0110: VIFCode(
-        # code=0x46,
-        coef=1e-1,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
-    ),
-    0b0100_0111: VIFCode(
-        # code=0x47,
-        coef=1e0,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_minute,
+    **_decimals(
+        0b0100_0000,
+        8,
+        -7,
+        VIFCodeKind.volume_flow.value,
+        VIFCodeUnit.meter_cubic_per_minute.value,
     ),
     # E100_1nnn - Volume flow (Meter cubic per second = m^3/s)
-    0b0100_1000: VIFCode(
-        # code=0x48,
-        coef=1e-9,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
-    ),
-    0b0100_1001: VIFCode(
-        # code=0x49,
-        coef=1e-8,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
-    ),
-    0b0100_1010: VIFCode(
-        # code=0x4A,
-        coef=1e-7,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
-    ),
-    0b0100_1011: VIFCode(
-        # code=0x4B,
-        coef=1e-6,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
-    ),
-    0b0100_1100: VIFCode(
-        # code=0x4C,
-        coef=1e-5,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
-    ),
-    0b0100_1101: VIFCode(
-        # code=0x4D,
-        coef=1e-4,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
-    ),
-    0b0100_1110: VIFCode(
-        # code=0x4E,
-        coef=1e-3,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
-    ),
-    0b0100_1111: VIFCode(
-        # code=0x4F,
-        coef=1e-2,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.meter_cubic_per_second,
+    **_decimals(
+        0b0100_1000,
+        8,
+        -9,
+        VIFCodeKind.volume_flow.value,
+        VIFCodeUnit.meter_cubic_per_second.value,
     ),
     # E101_0nnn - Mass flow (Kilogram per hour = kg/h)
-    0b0101_0000: VIFCode(
-        # code=0x50,
-        coef=1e-3,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
-    ),
-    0b0101_0001: VIFCode(
-        # code=0x51,
-        coef=1e-2,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
-    ),
-    0b0101_0010: VIFCode(
-        # code=0x52,
-        coef=1e-1,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
-    ),
-    0b0101_0011: VIFCode(
-        # code=0x53,
-        coef=1e0,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
-    ),
-    0b0101_0100: VIFCode(
-        # code=0x54,
-        coef=1e1,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
-    ),
-    0b0101_0101: VIFCode(
-        # code=0x55,
-        coef=1e2,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
-    ),
-    0b0101_0110: VIFCode(
-        # code=0x56,
-        coef=1e3,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
-    ),
-    0b0101_0111: VIFCode(
-        # code=0x57,
-        coef=1e4,
-        kind=VIFCodeKind.mass_flow,
-        unit=VIFCodeUnit.kilogram_per_hour,
+    **_decimals(
+        0b0101_0000,
+        8,
+        -3,
+        VIFCodeKind.mass_flow.value,
+        VIFCodeUnit.kilogram_per_hour.value,
     ),
     # E101_10nn - Flow temperature (Celsius = C)
-    0b0101_1000: VIFCode(
-        # code=0x58,
-        coef=1e-3,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0101_1001: VIFCode(
-        # code=0x59,
-        coef=1e-2,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0101_1010: VIFCode(
-        # code=0x5A,
-        coef=1e-1,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0101_1011: VIFCode(
-        # code=0x5B,
-        coef=1e0,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    # # E101_11nn - Return temperature (Celsius = C)
-    0b0101_1100: VIFCode(
-        # code=0x5C,
-        coef=1e-3,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0101_1101: VIFCode(
-        # code=0x5D,
-        coef=1e-2,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0101_1110: VIFCode(
-        # code=0x5E,
-        coef=1e-1,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0101_1111: VIFCode(
-        # code=0x5F,
-        coef=1e0,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.celsius,
+    **_decimals(
+        0b0101_1000,
+        4,
+        -3,
+        VIFCodeKind.flow_temperature.value,
+        VIFCodeUnit.celsius.value,
+    ),
+    # E101_11nn - Return temperature (Celsius = C)
+    **_decimals(
+        0b0101_1100,
+        4,
+        -3,
+        VIFCodeKind.return_temperature.value,
+        VIFCodeUnit.celsius.value,
     ),
     # E110_00nn - Temperature difference (Kelvin = K)
-    0b0110_0000: VIFCode(
-        # code=0x60,
-        coef=1e-3,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.kelvin,
-    ),
-    0b0110_0001: VIFCode(
-        # code=0x61,
-        coef=1e-2,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.kelvin,
-    ),
-    0b0110_0010: VIFCode(
-        # code=0x62,
-        coef=1e-1,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.kelvin,
-    ),
-    0b0110_0011: VIFCode(
-        # code=0x63,
-        coef=1e0,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.kelvin,
+    **_decimals(
+        0b0110_0000,
+        4,
+        -3,
+        VIFCodeKind.temperature_difference.value,
+        VIFCodeUnit.kelvin.value,
     ),
     # E110_01nn - External temperature (Celsius = C)
-    0b0110_0100: VIFCode(
-        # code=0x64,
-        coef=1e-3,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0110_0101: VIFCode(
-        # code=0x65,
-        coef=1e-2,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0110_0110: VIFCode(
-        # code=0x66,
-        coef=1e-1,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0110_0111: VIFCode(
-        # code=0x67,
-        coef=1e0,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.celsius,
+    **_decimals(
+        0b0110_0100,
+        4,
+        -3,
+        VIFCodeKind.external_temperature.value,
+        VIFCodeUnit.celsius.value,
     ),
     # E110_10nn - Pressure (bar)
-    0b0110_1000: VIFCode(
-        # code=0x68,
-        coef=1e-3,
-        kind=VIFCodeKind.pressure,
-        unit=VIFCodeUnit.bar,
-    ),
-    0b0110_1001: VIFCode(
-        # code=0x69,
-        coef=1e-2,
-        kind=VIFCodeKind.pressure,
-        unit=VIFCodeUnit.bar,
-    ),
-    0b0110_1010: VIFCode(
-        # code=0x6A,
-        coef=1e-1,
-        kind=VIFCodeKind.pressure,
-        unit=VIFCodeUnit.bar,
-    ),
-    0b0110_1011: VIFCode(
-        # code=0x6B,
-        coef=1e0,
-        kind=VIFCodeKind.pressure,
-        unit=VIFCodeUnit.bar,
+    **_decimals(
+        0b0110_1000, 4, -3, VIFCodeKind.pressure.value, VIFCodeUnit.bar.value
     ),
     # E110_110n - Time point (date or datetime)
     0b0110_1100: VIFCode(
-        # code=0x6C,
-        coef=1,
-        kind=VIFCodeKind.time_point,
-        unit=VIFCodeUnit.date,
+        coef=_POW10[0],
+        kind=VIFCodeKind.time_point.value,
+        unit=VIFCodeUnit.date.value,
     ),
     0b0110_1101: VIFCode(
-        # code=0x6D,
-        coef=1,
-        kind=VIFCodeKind.time_point,
-        unit=VIFCodeUnit.datetime,
+        coef=_POW10[0],
+        kind=VIFCodeKind.time_point.value,
+        unit=VIFCodeUnit.datetime.value,
     ),
     # E110_1110 = Heat Cost Allocator (H.C.A.) Units
     0b0110_1110: VIFCode(
-        # code=0x6E,
-        coef=1e0,
-        kind=VIFCodeKind.hca,
-        unit=VIFCodeUnit.hca,
+        coef=_POW10[0],
+        kind=VIFCodeKind.hca.value,
+        unit=VIFCodeUnit.hca.value,
     ),
     # Reserved
-    0b0110_1111: VIFCode(
-        # code=0x6F,
-        kind=VIFCodeKind.reserved
-    ),
+    0b0110_1111: VIFCode(kind=VIFCodeKind.reserved.value),
     # E111_00nn - Averaging duration (in seconds)
-    0b0111_0000: VIFCode(
-        # code=0x70,
-        coef=1,
-        kind=VIFCodeKind.averaging_duration,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0111_0001: VIFCode(
-        # code=0x71,
-        coef=60,
-        kind=VIFCodeKind.averaging_duration,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0111_0010: VIFCode(
-        # code=0x72,
-        coef=3600,
-        kind=VIFCodeKind.averaging_duration,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0111_0011: VIFCode(
-        # code=0x73,
-        coef=86400,
-        kind=VIFCodeKind.averaging_duration,
-        unit=VIFCodeUnit.second,
-    ),
+    **_durations(0b0111_0000, VIFCodeKind.averaging_duration.value),
     # E111_01nn - Actuality duration (in seconds)
-    0b0111_0100: VIFCode(
-        # code=0x74,
-        coef=1,
-        kind=VIFCodeKind.actuality_duration,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0111_0101: VIFCode(
-        # code=0x75,
-        coef=60,
-        kind=VIFCodeKind.actuality_duration,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0111_0110: VIFCode(
-        # code=0x76,
-        coef=3600,
-        kind=VIFCodeKind.actuality_duration,
-        unit=VIFCodeUnit.second,
-    ),
-    0b0111_0111: VIFCode(
-        # code=0x77,
-        coef=86400,
-        kind=VIFCodeKind.actuality_duration,
-        unit=VIFCodeUnit.second,
-    ),
+    **_durations(0b0111_0100, VIFCodeKind.actuality_duration.value),
     # E111_1000
-    0b0111_1000: VIFCode(
-        # code=0x78,
-        kind=VIFCodeKind.fabrication_no
-    ),
+    0b0111_1000: VIFCode(kind=VIFCodeKind.fabrication_no.value),
     # E111_1001
-    0b0111_1001: VIFCode(
-        # code=0x79,
-        kind=VIFCodeKind.enhanced
-    ),
+    0b0111_1001: VIFCode(kind=VIFCodeKind.enhanced.value),
     # E111_1010
-    0b0111_1010: VIFCode(
-        # code=0x7A,
-        kind=VIFCodeKind.bus_address
-    ),
+    0b0111_1010: VIFCode(kind=VIFCodeKind.bus_address.value),
     # special purpose VIF codes
-    0b0111_1100: VIFCode(
-        # code=0x7C,
-        kind=VIFCodeKind.user_definable
-    ),
-    0b0111_1110: VIFCode(
-        # code=0x7E,
-        kind=VIFCodeKind.any
-    ),
-    0b0111_1111: VIFCode(
-        # code=0x7F,
-        kind=VIFCodeKind.manufacturer_specific
-    ),
+    0b0111_1100: VIFCode(kind=VIFCodeKind.user_definable.value),
+    0b0111_1110: VIFCode(kind=VIFCodeKind.any.value),
+    0b0111_1111: VIFCode(kind=VIFCodeKind.manufacturer_specific.value),
     # extension codes
-    0b1111_1011: VIFCode(kind=VIFCodeKind.extension),
-    0b1111_1101: VIFCode(kind=VIFCodeKind.extension),
+    0b1111_1011: VIFCode(kind=VIFCodeKind.extension.value),
+    0b1111_1101: VIFCode(kind=VIFCodeKind.extension.value),
 }
 
-_VIF_CODE_FB_EXTENSION_MAP: dict[int, VIFCode] = {
+_VIF_CODE_FB_EXTENSION_MAP_RAW: dict[int, VIFCode] = {
     # E000_000n
-    0b000_0000: VIFCode(
-        coef=1e-1, kind=VIFCodeKind.energy, unit=VIFCodeUnit.mega_watt_hour
-    ),
-    0b000_0001: VIFCode(
-        coef=1e0, kind=VIFCodeKind.energy, unit=VIFCodeUnit.mega_watt_hour
+    **_decimals(
+        0b0000_0000,
+        2,
+        -1,
+        VIFCodeKind.energy.value,
+        VIFCodeUnit.mega_watt_hour.value,
     ),
     # E000_001n
     0b000_0010: _reserved_vif_code,
     0b000_0011: _reserved_vif_code,
     # E000_01nn
-    0b000_0100: _reserved_vif_code,
-    0b000_0101: _reserved_vif_code,
-    0b000_0110: _reserved_vif_code,
-    0b000_0111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0000_0100, 0b0000_1000), _reserved_vif_code),
     # E000_100n
-    0b000_1000: VIFCode(
-        coef=1e-1, kind=VIFCodeKind.energy, unit=VIFCodeUnit.giga_joule
-    ),
-    0b000_1001: VIFCode(
-        coef=1e0, kind=VIFCodeKind.energy, unit=VIFCodeUnit.giga_joule
+    **_decimals(
+        0b0000_1000,
+        2,
+        -1,
+        VIFCodeKind.energy.value,
+        VIFCodeUnit.giga_joule.value,
     ),
     # E000_101n
     0b0000_1010: _reserved_vif_code,
     0b0000_1011: _reserved_vif_code,
     # E000_11nn
-    0b0000_1100: _reserved_vif_code,
-    0b0000_1101: _reserved_vif_code,
-    0b0000_1110: _reserved_vif_code,
-    0b0000_1111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0000_1100, 0b0001_0000), _reserved_vif_code),
     # E001_000n
-    0b0001_0000: VIFCode(
-        coef=1e2, kind=VIFCodeKind.volume, unit=VIFCodeUnit.meter_cubic
-    ),
-    0b0001_0001: VIFCode(
-        coef=1e3, kind=VIFCodeKind.volume, unit=VIFCodeUnit.meter_cubic
+    **_decimals(
+        0b0001_0000,
+        2,
+        2,
+        VIFCodeKind.volume.value,
+        VIFCodeUnit.meter_cubic.value,
     ),
     # E001_001n
     0b0001_0010: _reserved_vif_code,
     0b0001_0011: _reserved_vif_code,
     # E001_01nn
-    0b0001_0100: _reserved_vif_code,
-    0b0001_0101: _reserved_vif_code,
-    0b0001_0110: _reserved_vif_code,
-    0b0001_0111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0001_0100, 0b0001_1000), _reserved_vif_code),
     # E001_100n
-    0b0001_1000: VIFCode(
-        coef=1e2, kind=VIFCodeKind.mass, unit=VIFCodeUnit.tonne
-    ),
-    0b0001_1001: VIFCode(
-        coef=1e3, kind=VIFCodeKind.mass, unit=VIFCodeUnit.tonne
+    **_decimals(
+        0b0001_1000, 2, 2, VIFCodeKind.mass.value, VIFCodeUnit.tonne.value
     ),
     # E001_1010 to E010_0000
-    0b0001_1010: _reserved_vif_code,
-    0b0001_1011: _reserved_vif_code,
-    0b0001_1100: _reserved_vif_code,
-    0b0001_1101: _reserved_vif_code,
-    0b0001_1110: _reserved_vif_code,
-    0b0001_1111: _reserved_vif_code,
-    0b0010_0000: _reserved_vif_code,
+    **dict.fromkeys(range(0b0001_1010, 0b0010_0001), _reserved_vif_code),
     # E010_0001
     0b0010_0001: VIFCode(
-        coef=1e-1, kind=VIFCodeKind.volume, unit=VIFCodeUnit.feet_cubic
-    ),
-    # E010_0010
-    0b0010_0010: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.american_gallon,
-    ),
-    # E010_0011
-    0b0010_0011: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.volume,
-        unit=VIFCodeUnit.american_gallon,
+        coef=_POW10[-1],
+        kind=VIFCodeKind.volume.value,
+        unit=VIFCodeUnit.feet_cubic.value,
+    ),
+    # E010_001n
+    **_decimals(
+        0b0010_0010,
+        2,
+        -1,
+        VIFCodeKind.volume.value,
+        VIFCodeUnit.american_gallon.value,
     ),
     # E010_0100
     0b0010_0100: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.american_gallon_per_minute,
+        coef=_POW10[-3],
+        kind=VIFCodeKind.volume_flow.value,
+        unit=VIFCodeUnit.american_gallon_per_minute.value,
     ),
     # E010_0101
     0b0010_0101: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.american_gallon_per_minute,
+        coef=_POW10[0],
+        kind=VIFCodeKind.volume_flow.value,
+        unit=VIFCodeUnit.american_gallon_per_minute.value,
     ),
     # E010_0110
     0b0010_0110: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.volume_flow,
-        unit=VIFCodeUnit.american_gallon_per_hour,
+        coef=_POW10[0],
+        kind=VIFCodeKind.volume_flow.value,
+        unit=VIFCodeUnit.american_gallon_per_hour.value,
     ),
     # E010_0111
     0b0010_0111: _reserved_vif_code,
     # E010_100n
-    0b0010_1000: VIFCode(
-        coef=1e-1, kind=VIFCodeKind.power, unit=VIFCodeUnit.mega_watt
-    ),
-    0b0010_1001: VIFCode(
-        coef=1, kind=VIFCodeKind.power, unit=VIFCodeUnit.mega_watt
+    **_decimals(
+        0b0010_1000, 2, -1, VIFCodeKind.power.value, VIFCodeUnit.mega_watt.value
     ),
     # E010_101n
     0b0010_1010: _reserved_vif_code,
     0b0010_1011: _reserved_vif_code,
     # E010_11nn
-    0b0010_1100: _reserved_vif_code,
-    0b0010_1101: _reserved_vif_code,
-    0b0010_1110: _reserved_vif_code,
-    0b0010_1111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0010_1100, 0b0011_0000), _reserved_vif_code),
     # E011_000n
-    0b0011_0000: VIFCode(
-        coef=1e-1, kind=VIFCodeKind.power, unit=VIFCodeUnit.giga_joule_per_hour
-    ),
-    0b0011_0001: VIFCode(
-        coef=1, kind=VIFCodeKind.power, unit=VIFCodeUnit.giga_joule_per_hour
+    **_decimals(
+        0b0011_0000,
+        2,
+        -1,
+        VIFCodeKind.power.value,
+        VIFCodeUnit.giga_joule_per_hour.value,
     ),
     # E011_0010 to E101_0111
-    0b0011_0010: _reserved_vif_code,
-    0b0011_0011: _reserved_vif_code,
-    0b0011_0100: _reserved_vif_code,
-    0b0011_0101: _reserved_vif_code,
-    0b0011_0110: _reserved_vif_code,
-    0b0011_0111: _reserved_vif_code,
-    0b0011_1000: _reserved_vif_code,
-    0b0011_1001: _reserved_vif_code,
-    0b0011_1010: _reserved_vif_code,
-    0b0011_1011: _reserved_vif_code,
-    0b0011_1100: _reserved_vif_code,
-    0b0011_1101: _reserved_vif_code,
-    0b0011_1110: _reserved_vif_code,
-    0b0011_1111: _reserved_vif_code,
-    0b0100_0000: _reserved_vif_code,
-    0b0100_0001: _reserved_vif_code,
-    0b0100_0010: _reserved_vif_code,
-    0b0100_0011: _reserved_vif_code,
-    0b0100_0100: _reserved_vif_code,
-    0b0100_0101: _reserved_vif_code,
-    0b0100_0110: _reserved_vif_code,
-    0b0100_0111: _reserved_vif_code,
-    0b0100_1000: _reserved_vif_code,
-    0b0100_1001: _reserved_vif_code,
-    0b0100_1010: _reserved_vif_code,
-    0b0100_1011: _reserved_vif_code,
-    0b0100_1100: _reserved_vif_code,
-    0b0100_1101: _reserved_vif_code,
-    0b0100_1110: _reserved_vif_code,
-    0b0100_1111: _reserved_vif_code,
-    0b0101_0000: _reserved_vif_code,
-    0b0101_0001: _reserved_vif_code,
-    0b0101_0010: _reserved_vif_code,
-    0b0101_0011: _reserved_vif_code,
-    0b0101_0100: _reserved_vif_code,
-    0b0101_0101: _reserved_vif_code,
-    0b0101_0110: _reserved_vif_code,
-    0b0101_0111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0011_0010, 0b0101_1000), _reserved_vif_code),
     # E101_10nn
-    0b0101_1000: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0101_1001: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0101_1010: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0101_1011: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.flow_temperature,
-        unit=VIFCodeUnit.fahrenheit,
+    **_decimals(
+        0b0101_1000,
+        4,
+        -3,
+        VIFCodeKind.flow_temperature.value,
+        VIFCodeUnit.fahrenheit.value,
     ),
     # E101_11nn
-    0b0101_1100: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0101_1101: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0101_1110: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0101_1111: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.return_temperature,
-        unit=VIFCodeUnit.fahrenheit,
+    **_decimals(
+        0b0101_1100,
+        4,
+        -3,
+        VIFCodeKind.return_temperature.value,
+        VIFCodeUnit.fahrenheit.value,
     ),
     # E110_00nn
-    0b0110_0000: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0110_0001: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0110_0010: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0110_0011: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.temperature_difference,
-        unit=VIFCodeUnit.fahrenheit,
+    **_decimals(
+        0b0110_0000,
+        4,
+        -3,
+        VIFCodeKind.temperature_difference.value,
+        VIFCodeUnit.fahrenheit.value,
     ),
     # E110_01nn
-    0b0110_0100: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0110_0101: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0110_0110: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0110_0111: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.external_temperature,
-        unit=VIFCodeUnit.fahrenheit,
+    **_decimals(
+        0b0110_0100,
+        4,
+        -3,
+        VIFCodeKind.external_temperature.value,
+        VIFCodeUnit.fahrenheit.value,
     ),
     # E110_1nnn
-    0b0110_1000: _reserved_vif_code,
-    0b0110_1001: _reserved_vif_code,
-    0b0110_1010: _reserved_vif_code,
-    0b0110_1011: _reserved_vif_code,
-    0b0110_1100: _reserved_vif_code,
-    0b0110_1101: _reserved_vif_code,
-    0b0110_1110: _reserved_vif_code,
-    0b0110_1111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0110_1000, 0b0111_0000), _reserved_vif_code),
     # E111_00nn
-    0b0111_0000: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0111_0001: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0111_0010: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.fahrenheit,
-    ),
-    0b0111_0011: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.fahrenheit,
+    **_decimals(
+        0b0111_0000,
+        4,
+        -3,
+        VIFCodeKind.cold_warm_temperature_limit.value,
+        VIFCodeUnit.fahrenheit.value,
     ),
     # E111_01nn
-    0b0111_0100: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0111_0101: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0111_0110: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.celsius,
-    ),
-    0b0111_0111: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.cold_warm_temperature_limit,
-        unit=VIFCodeUnit.celsius,
+    **_decimals(
+        0b0111_0100,
+        4,
+        -3,
+        VIFCodeKind.cold_warm_temperature_limit.value,
+        VIFCodeUnit.celsius.value,
     ),
     # E111_1nnn
-    0b0111_1000: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0111_1001: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0111_1010: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0111_1011: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0111_1100: VIFCode(
-        coef=1e1,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0111_1101: VIFCode(
-        coef=1e2,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0111_1110: VIFCode(
-        coef=1e3,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
-    ),
-    0b0111_1111: VIFCode(
-        coef=1e4,
-        kind=VIFCodeKind.cumul_count_max_power,
-        unit=VIFCodeUnit.watt,
+    **_decimals(
+        0b0111_1000,
+        8,
+        -3,
+        VIFCodeKind.cumul_count_max_power.value,
+        VIFCodeUnit.watt.value,
     ),
 }
 
 
-_VIF_CODE_FD_EXTENSION_MAP: dict[int, VIFCode] = {
+_VIF_CODE_FD_EXTENSION_MAP_RAW: dict[int, VIFCode] = {
     # E000_00nn - currency units (credit)
-    0b0000_0000: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_credit,
-    ),
-    0b0000_0001: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_credit,
-    ),
-    0b0000_0010: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_credit,
-    ),
-    0b0000_0011: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_credit,
+    **_decimals(
+        0b0000_0000,
+        4,
+        -3,
+        VIFCodeKind.currency.value,
+        VIFCodeUnit.currency_credit.value,
     ),
     # E000_01nn - currency units (debit)
-    0b0000_0100: VIFCode(
-        coef=1e-3,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_debit,
-    ),
-    0b0000_0101: VIFCode(
-        coef=1e-2,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_debit,
-    ),
-    0b0000_0110: VIFCode(
-        coef=1e-1,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_debit,
-    ),
-    0b0000_0111: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.currency,
-        unit=VIFCodeUnit.currency_debit,
+    **_decimals(
+        0b0000_0100,
+        4,
+        -3,
+        VIFCodeKind.currency.value,
+        VIFCodeUnit.currency_debit.value,
     ),
     # E000_1000 - E000_1111 -> Enhanced Identification
-    0b0000_1000: VIFCode(kind=VIFCodeKind.access_number),
-    0b0000_1001: VIFCode(kind=VIFCodeKind.medium),
-    0b0000_1010: VIFCode(kind=VIFCodeKind.manufacturer),
-    0b0000_1011: VIFCode(kind=VIFCodeKind.param_set_identification),
-    0b0000_1100: VIFCode(kind=VIFCodeKind.model_version),
-    0b0000_1101: VIFCode(kind=VIFCodeKind.hardware_version),
-    0b0000_1110: VIFCode(kind=VIFCodeKind.firmware_version),
-    0b0000_1111: VIFCode(kind=VIFCodeKind.software_version),
+    0b0000_1000: VIFCode(kind=VIFCodeKind.access_number.value),
+    0b0000_1001: VIFCode(kind=VIFCodeKind.medium.value),
+    0b0000_1010: VIFCode(kind=VIFCodeKind.manufacturer.value),
+    0b0000_1011: VIFCode(kind=VIFCodeKind.param_set_identification.value),
+    0b0000_1100: VIFCode(kind=VIFCodeKind.model_version.value),
+    0b0000_1101: VIFCode(kind=VIFCodeKind.hardware_version.value),
+    0b0000_1110: VIFCode(kind=VIFCodeKind.firmware_version.value),
+    0b0000_1111: VIFCode(kind=VIFCodeKind.software_version.value),
     # E001_0000 - E001_1001 - TC294 WGI req(uirement)s
-    0b0001_0000: VIFCode(kind=VIFCodeKind.customer_location),
-    0b0001_0001: VIFCode(kind=VIFCodeKind.customer),
-    0b0001_0010: VIFCode(kind=VIFCodeKind.access_code_user),
-    0b0001_0011: VIFCode(kind=VIFCodeKind.access_code_operator),
-    0b0001_0100: VIFCode(kind=VIFCodeKind.access_code_system_operator),
-    0b0001_0101: VIFCode(kind=VIFCodeKind.access_code_developer),
-    0b0001_0110: VIFCode(kind=VIFCodeKind.password),
-    0b0001_0111: VIFCode(kind=VIFCodeKind.error_flags_binary),
-    0b0001_1000: VIFCode(kind=VIFCodeKind.error_mask),
+    0b0001_0000: VIFCode(kind=VIFCodeKind.customer_location.value),
+    0b0001_0001: VIFCode(kind=VIFCodeKind.customer.value),
+    0b0001_0010: VIFCode(kind=VIFCodeKind.access_code_user.value),
+    0b0001_0011: VIFCode(kind=VIFCodeKind.access_code_operator.value),
+    0b0001_0100: VIFCode(kind=VIFCodeKind.access_code_system_operator.value),
+    0b0001_0101: VIFCode(kind=VIFCodeKind.access_code_developer.value),
+    0b0001_0110: VIFCode(kind=VIFCodeKind.password.value),
+    0b0001_0111: VIFCode(kind=VIFCodeKind.error_flags_binary.value),
+    0b0001_1000: VIFCode(kind=VIFCodeKind.error_mask.value),
     0b0001_1001: _reserved_vif_code,
-    0b0001_1010: VIFCode(kind=VIFCodeKind.digital_output_binary),
-    0b0001_1011: VIFCode(kind=VIFCodeKind.digital_input_binary),
-    0b0001_1100: VIFCode(kind=VIFCodeKind.baudrate, unit=VIFCodeUnit.baud),
-    0b0001_1101: VIFCode(kind=VIFCodeKind.response_delay_time),
-    0b0001_1110: VIFCode(kind=VIFCodeKind.retry),
+    0b0001_1010: VIFCode(kind=VIFCodeKind.digital_output_binary.value),
+    0b0001_1011: VIFCode(kind=VIFCodeKind.digital_input_binary.value),
+    0b0001_1100: VIFCode(
+        kind=VIFCodeKind.baudrate.value, unit=VIFCodeUnit.baud.value
+    ),
+    0b0001_1101: VIFCode(kind=VIFCodeKind.response_delay_time.value),
+    0b0001_1110: VIFCode(kind=VIFCodeKind.retry.value),
     0b0001_1111: _reserved_vif_code,
-    0b0010_0000: VIFCode(kind=VIFCodeKind.first_storage),
-    0b0010_0001: VIFCode(kind=VIFCodeKind.last_storage),
-    0b0010_0010: VIFCode(kind=VIFCodeKind.storage_block_size),
+    0b0010_0000: VIFCode(kind=VIFCodeKind.first_storage.value),
+    0b0010_0001: VIFCode(kind=VIFCodeKind.last_storage.value),
+    0b0010_0010: VIFCode(kind=VIFCodeKind.storage_block_size.value),
     0b0010_0011: _reserved_vif_code,
     # E010_000 - E010_1111 - Enhanced storage management
-    0b0010_0100: VIFCode(
-        coef=1, unit=VIFCodeUnit.second, kind=VIFCodeKind.storage_interval
-    ),
-    0b0010_0101: VIFCode(
-        coef=60, unit=VIFCodeUnit.second, kind=VIFCodeKind.storage_interval
-    ),
-    0b0010_0110: VIFCode(
-        coef=3600, unit=VIFCodeUnit.second, kind=VIFCodeKind.storage_interval
-    ),
-    0b0010_0111: VIFCode(
-        coef=86400, unit=VIFCodeUnit.second, kind=VIFCodeKind.storage_interval
-    ),
+    **_durations(0b0010_0100, VIFCodeKind.storage_interval.value),
     0b0010_1000: VIFCode(
-        coef=1, unit=VIFCodeUnit.month, kind=VIFCodeKind.storage_interval
+        coef=_POW10[0],
+        unit=VIFCodeUnit.month.value,
+        kind=VIFCodeKind.storage_interval.value,
     ),
     0b0010_1001: VIFCode(
-        coef=1, unit=VIFCodeUnit.year, kind=VIFCodeKind.storage_interval
+        coef=_POW10[0],
+        unit=VIFCodeUnit.year.value,
+        kind=VIFCodeKind.storage_interval.value,
     ),
     0b0010_1010: _reserved_vif_code,
     0b0010_1011: _reserved_vif_code,
-    0b0010_1100: VIFCode(
-        coef=1,
-        unit=VIFCodeUnit.second,
-        kind=VIFCodeKind.duration_since_last_readout,
-    ),
-    0b0010_1101: VIFCode(
-        coef=60,
-        unit=VIFCodeUnit.second,
-        kind=VIFCodeKind.duration_since_last_readout,
-    ),
-    0b0010_1110: VIFCode(
-        coef=3600,
-        unit=VIFCodeUnit.second,
-        kind=VIFCodeKind.duration_since_last_readout,
-    ),
-    0b0010_1111: VIFCode(
-        coef=86400,
-        unit=VIFCodeUnit.second,
-        kind=VIFCodeKind.duration_since_last_readout,
-    ),
+    **_durations(0b0010_1100, VIFCodeKind.duration_since_last_readout.value),
     # Enhanced tariff management
     0b0011_0000: VIFCode(
-        kind=VIFCodeKind.tariff_start, unit=VIFCodeUnit.datetime
+        kind=VIFCodeKind.tariff_start.value, unit=VIFCodeUnit.datetime.value
     ),
     0b0011_0001: VIFCode(
-        coef=60, kind=VIFCodeKind.tariff_duration, unit=VIFCodeUnit.second
+        coef=_DURATION_COEFS[1],
+        kind=VIFCodeKind.tariff_duration.value,
+        unit=VIFCodeUnit.second.value,
     ),
     0b0011_0010: VIFCode(
-        coef=3600, kind=VIFCodeKind.tariff_duration, unit=VIFCodeUnit.second
+        coef=_DURATION_COEFS[2],
+        kind=VIFCodeKind.tariff_duration.value,
+        unit=VIFCodeUnit.second.value,
     ),
     0b0011_0011: VIFCode(
-        coef=86400, kind=VIFCodeKind.tariff_duration, unit=VIFCodeUnit.second
-    ),
-    0b0011_0100: VIFCode(
-        coef=1, kind=VIFCodeKind.tariff_period, unit=VIFCodeUnit.second
-    ),
-    0b0011_0101: VIFCode(
-        coef=60, kind=VIFCodeKind.tariff_period, unit=VIFCodeUnit.second
-    ),
-    0b0011_0110: VIFCode(
-        coef=3600, kind=VIFCodeKind.tariff_period, unit=VIFCodeUnit.second
-    ),
-    0b0011_0111: VIFCode(
-        coef=86400, kind=VIFCodeKind.tariff_period, unit=VIFCodeUnit.second
+        coef=_DURATION_COEFS[3],
+        kind=VIFCodeKind.tariff_duration.value,
+        unit=VIFCodeUnit.second.value,
     ),
+    **_durations(0b0011_0100, VIFCodeKind.tariff_period.value),
     0b0011_1000: VIFCode(
-        coef=1, kind=VIFCodeKind.tariff_period, unit=VIFCodeUnit.month
+        coef=_POW10[0],
+        kind=VIFCodeKind.tariff_period.value,
+        unit=VIFCodeUnit.month.value,
     ),
     0b0011_1001: VIFCode(
-        coef=1, kind=VIFCodeKind.tariff_period, unit=VIFCodeUnit.year
+        coef=_POW10[0],
+        kind=VIFCodeKind.tariff_period.value,
+        unit=VIFCodeUnit.year.value,
     ),
     0b0011_1010: VIFCode(
-        kind=VIFCodeKind.no_vif, unit=VIFCodeUnit.dimensionless
+        kind=VIFCodeKind.no_vif.value, unit=VIFCodeUnit.dimensionless.value
     ),
-    0b0011_1011: _reserved_vif_code,
-    0b0011_1100: _reserved_vif_code,
-    0b0011_1101: _reserved_vif_code,
-    0b0011_1110: _reserved_vif_code,
-    0b0011_1111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0011_1011, 0b0100_0000), _reserved_vif_code),
     # Electrical units
-    0b0100_0000: VIFCode(
-        coef=1e-9, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_0001: VIFCode(
-        coef=1e-8, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_0010: VIFCode(
-        coef=1e-7, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_0011: VIFCode(
-        coef=1e-6, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_0100: VIFCode(
-        coef=1e-5, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_0101: VIFCode(
-        coef=1e-4, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_0110: VIFCode(
-        coef=1e-3, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_0111: VIFCode(
-        coef=1e-2, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1000: VIFCode(
-        coef=1e-1, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1001: VIFCode(
-        coef=1, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1010: VIFCode(
-        coef=1e1, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1011: VIFCode(
-        coef=1e2, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1100: VIFCode(
-        coef=1e3, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1101: VIFCode(
-        coef=1e4, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1110: VIFCode(
-        coef=1e5, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0100_1111: VIFCode(
-        coef=1e6, kind=VIFCodeKind.voltage, unit=VIFCodeUnit.volt
-    ),
-    0b0101_0000: VIFCode(
-        coef=1e-12, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_0001: VIFCode(
-        coef=1e-11, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_0010: VIFCode(
-        coef=1e-10, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_0011: VIFCode(
-        coef=1e-9, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_0100: VIFCode(
-        coef=1e-8, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_0101: VIFCode(
-        coef=1e-7, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_0110: VIFCode(
-        coef=1e-6, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_0111: VIFCode(
-        coef=1e-5, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1000: VIFCode(
-        coef=1e-4, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1001: VIFCode(
-        coef=1e-3, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1010: VIFCode(
-        coef=1e-2, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1011: VIFCode(
-        coef=1e-1, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1100: VIFCode(
-        coef=1, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1101: VIFCode(
-        coef=1e1, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1110: VIFCode(
-        coef=1e2, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0101_1111: VIFCode(
-        coef=1e3, kind=VIFCodeKind.current, unit=VIFCodeUnit.amper
-    ),
-    0b0110_0000: VIFCode(kind=VIFCodeKind.reset_counter),
-    0b0110_0001: VIFCode(kind=VIFCodeKind.cumul_counter),
-    0b0110_0010: VIFCode(kind=VIFCodeKind.control_signal),
-    0b0110_0011: VIFCode(kind=VIFCodeKind.week_day),
-    0b0110_0100: VIFCode(kind=VIFCodeKind.week_number),
-    0b0110_0101: VIFCode(kind=VIFCodeKind.day_change_timepoint),
-    0b0110_0110: VIFCode(kind=VIFCodeKind.param_activation_state),
-    0b0110_0111: VIFCode(kind=VIFCodeKind.special_supplier_info),
+    # E100_nnnn - Voltage (Volt = V)
+    **_decimals(
+        0b0100_0000, 16, -9, VIFCodeKind.voltage.value, VIFCodeUnit.volt.value
+    ),
+    # E101_nnnn - Current (Ampere = A)
+    **_decimals(
+        0b0101_0000, 16, -12, VIFCodeKind.current.value, VIFCodeUnit.amper.value
+    ),
+    0b0110_0000: VIFCode(kind=VIFCodeKind.reset_counter.value),
+    0b0110_0001: VIFCode(kind=VIFCodeKind.cumul_counter.value),
+    0b0110_0010: VIFCode(kind=VIFCodeKind.control_signal.value),
+    0b0110_0011: VIFCode(kind=VIFCodeKind.week_day.value),
+    0b0110_0100: VIFCode(kind=VIFCodeKind.week_number.value),
+    0b0110_0101: VIFCode(kind=VIFCodeKind.day_change_timepoint.value),
+    0b0110_0110: VIFCode(kind=VIFCodeKind.param_activation_state.value),
+    0b0110_0111: VIFCode(kind=VIFCodeKind.special_supplier_info.value),
     # E110_10pp - Duration since last cumulation
     0b0110_1000: VIFCode(
-        coef=3600,
-        kind=VIFCodeKind.duration_since_last_cumulation,
-        unit=VIFCodeUnit.second,
+        coef=_DURATION_COEFS[2],
+        kind=VIFCodeKind.duration_since_last_cumulation.value,
+        unit=VIFCodeUnit.second.value,
     ),
     0b0110_1001: VIFCode(
-        coef=86400,
-        kind=VIFCodeKind.duration_since_last_cumulation,
-        unit=VIFCodeUnit.second,
+        coef=_DURATION_COEFS[3],
+        kind=VIFCodeKind.duration_since_last_cumulation.value,
+        unit=VIFCodeUnit.second.value,
     ),
     0b0110_1010: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.duration_since_last_cumulation,
-        unit=VIFCodeUnit.month,
+        coef=_POW10[0],
+        kind=VIFCodeKind.duration_since_last_cumulation.value,
+        unit=VIFCodeUnit.month.value,
     ),
     0b0110_1011: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.duration_since_last_cumulation,
-        unit=VIFCodeUnit.year,
+        coef=_POW10[0],
+        kind=VIFCodeKind.duration_since_last_cumulation.value,
+        unit=VIFCodeUnit.year.value,
     ),
     0b0110_1100: VIFCode(
-        coef=3600,
-        kind=VIFCodeKind.operating_time_battery,
-        unit=VIFCodeUnit.second,
+        coef=_DURATION_COEFS[2],
+        kind=VIFCodeKind.operating_time_battery.value,
+        unit=VIFCodeUnit.second.value,
     ),
     0b0110_1101: VIFCode(
-        coef=86400,
-        kind=VIFCodeKind.operating_time_battery,
-        unit=VIFCodeUnit.second,
+        coef=_DURATION_COEFS[3],
+        kind=VIFCodeKind.operating_time_battery.value,
+        unit=VIFCodeUnit.second.value,
     ),
     0b0110_1110: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.operating_time_battery,
-        unit=VIFCodeUnit.month,
+        coef=_POW10[0],
+        kind=VIFCodeKind.operating_time_battery.value,
+        unit=VIFCodeUnit.month.value,
     ),
     0b0110_1111: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.operating_time_battery,
-        unit=VIFCodeUnit.year,
+        coef=_POW10[0],
+        kind=VIFCodeKind.operating_time_battery.value,
+        unit=VIFCodeUnit.year.value,
     ),
     0b0111_0000: VIFCode(
-        coef=1,
-        kind=VIFCodeKind.battery_change_datetime,
-        unit=VIFCodeUnit.datetime,
+        coef=_POW10[0],
+        kind=VIFCodeKind.battery_change_datetime.value,
+        unit=VIFCodeUnit.datetime.value,
     ),
-    0b0111_0001: _reserved_vif_code,
-    0b0111_0010: _reserved_vif_code,
-    0b0111_0011: _reserved_vif_code,
-    0b0111_0100: _reserved_vif_code,
-    0b0111_0101: _reserved_vif_code,
-    0b0111_0110: _reserved_vif_code,
-    0b0111_0111: _reserved_vif_code,
-    0b0111_1000: _reserved_vif_code,
-    0b0111_1001: _reserved_vif_code,
-    0b0111_1010: _reserved_vif_code,
-    0b0111_1011: _reserved_vif_code,
-    0b0111_1100: _reserved_vif_code,
-    0b0111_1101: _reserved_vif_code,
-    0b0111_1110: _reserved_vif_code,
-    0b0111_1111: _reserved_vif_code,
+    **dict.fromkeys(range(0b0111_0001, 0b1000_0000), _reserved_vif_code),
 }
 
 
-def _get_code(value: int, /, source: Mapping[int, VIFCode]) -> None | VIFCode:
-    """Return the VIFCode according to the given VIF.
+# the canonical instances of the VIF codes
+_VIF_CODE_POOL: dict[VIFCode, VIFCode] = {}
+
+
+def _intern(codes: dict[int, VIFCode]) -> dict[int, VIFCode]:
+    """Replace the VIF codes of `codes` with their canonical instances.
+
+    The equal codes of all the maps become the same object.
+    """
+    for byte, code in codes.items():
+        codes[byte] = _VIF_CODE_POOL.setdefault(code, code)
+    return codes
+
+
+# read-only views of the code maps above
+if sys.version_info >= (3, 15):
+    _freeze = frozendict  # noqa: F821
+else:
+    _freeze = MappingProxyType
+
+VIF_CODE_MAP: Mapping[int, VIFCode] = _freeze(_intern(_VIF_CODE_MAP_RAW))
+VIF_CODE_FB_EXTENSION_MAP: Mapping[int, VIFCode] = _freeze(
+    _intern(_VIF_CODE_FB_EXTENSION_MAP_RAW)
+)
+VIF_CODE_FD_EXTENSION_MAP: Mapping[int, VIFCode] = _freeze(
+    _intern(_VIF_CODE_FD_EXTENSION_MAP_RAW)
+)
+
+
+def _build_table(
+    source: Mapping[int, VIFCode],
+) -> tuple[None | VIFCode, ...]:
+    """Return a lookup table indexed by a byte value.
+
+    A code is searched by the data bits (0x7F) of a byte first,
+    then by the byte itself, i.e. with the extension bit set.
 
     Parameters
     ----------
-    value : int
-        either an integer or VIF class
     source : Mapping[int, VIFCode]
-        a source table which retrieving the VIF codes from
+        a mapping of byte values to VIF codes
+
+    Returns
+    -------
+    tuple[None | VIFCode, ...]
+        the table of 256 items, None stands for an absent code
+    """
+    return tuple(
+        source.get(byte & 0x7F) or source.get(byte) for byte in range(256)
+    )
+
+
+_VIF_CODE_TABLE = _build_table(VIF_CODE_MAP)
+_VIF_CODE_FB_EXTENSION_TABLE = _build_table(VIF_CODE_FB_EXTENSION_MAP)
+_VIF_CODE_FD_EXTENSION_TABLE = _build_table(VIF_CODE_FD_EXTENSION_MAP)
+
+
+def _build_coefs(table: Sequence[None | VIFCode]) -> "array[float]":
+    """Return the coefficients of a lookup table as a flat array.
+
+    Parameters
+    ----------
+    table : Sequence[None | VIFCode]
+        a lookup table indexed by a byte value
+
+    Returns
+    -------
+    array[float]
+        the coefficients of 256 items, NaN stands for an absent code
+    """
+    return array("d", [nan if code is None else code.coef for code in table])
+
+
+_VIF_COEFS = _build_coefs(_VIF_CODE_TABLE)
+_VIF_FB_EXTENSION_COEFS = _build_coefs(_VIF_CODE_FB_EXTENSION_TABLE)
+_VIF_FD_EXTENSION_COEFS = _build_coefs(_VIF_CODE_FD_EXTENSION_TABLE)
+
+
+def _select_coefs(extension_byte: None | int) -> "array[float]":
+    """Return the coefficient array according to `extension_byte`.
+
+    Parameters
+    ----------
+    extension_byte : None | int
+        None for the main table or an extension byte
 
     Raises
     ------
-    MBusValidationError
-        if `value` is not within the byte range
+    ValueError
+        if extension code is invalid
 
     Returns
     -------
-    None | VIFCode
+    array[float]
     """
-    # Value validation by casting to VIF.
-    # The `int(value)` is important:
-    # VIF < TelegramField < int and (!)
-    # a VIF does not accept a TelegramField.
-    vif = VIF(int(value))
-    if code := source.get(vif.data):
-        return code
-    # trying with an extension bit set
-    return source.get(int(vif))
+    if extension_byte is None:
+        return _VIF_COEFS
+    if extension_byte == 0xFB:
+        return _VIF_FB_EXTENSION_COEFS
+    if extension_byte == 0xFD:
+        return _VIF_FD_EXTENSION_COEFS
+    msg = f"wrong extension_byte={extension_byte}"
+    raise ValueError(msg)
+
+
+# a perfect cache: the (byte, extension_byte) keys of 3 tables x 256 bytes
+@lru_cache(maxsize=3 * 256)
+def _get_code(byte: int, extension_byte: None | int) -> None | VIFCode:
+    """Return VIFCode of a valid `byte` from the table of `extension_byte`."""
+    if extension_byte is None:
+        return _VIF_CODE_TABLE[byte]
+    if extension_byte == 0xFB:
+        return _VIF_CODE_FB_EXTENSION_TABLE[byte]
+    if extension_byte == 0xFD:
+        return _VIF_CODE_FD_EXTENSION_TABLE[byte]
+    msg = f"wrong extension_byte={extension_byte}"
+    raise ValueError(msg)
 
 
 def get_code(
@@ -1624,6 +842,10 @@ def get_code(
 ) -> None | VIFCode:
     """Return VIFCode according to `value` byte.
 
+    Notes
+    -----
+    The lookups are cached, the VIF codes are immutable.
+
     Parameters
     ----------
     value : int | VIF
@@ -1634,6 +856,8 @@ def get_code(
 
     Raises
     ------
+    MBusValidationError
+        if `value` is not within the byte range
     ValueError
         if extension code is invalid
 
@@ -1641,12 +865,85 @@ def get_code(
     -------
     None | VIFCode
     """
-    value = int(value)  # see type hints for mapping -> int key
-    if extension_byte is None:
-        return _get_code(value, source=_VIF_CODE_MAP)
-    if extension_byte == 0xFB:
-        return _get_code(value, source=_VIF_CODE_FB_EXTENSION_MAP)
-    if extension_byte == 0xFD:
-        return _get_code(value, source=_VIF_CODE_FD_EXTENSION_MAP)
-    msg = f"wrong extension_byte={extension_byte}"
-    raise ValueError(msg)
+    return _get_code(validate_byte(int(value)), extension_byte)
+
+
+def get_coef(
+    value: int | VIF | VIFE,
+    *,
+    extension_byte: None | int | VIF = None,
+) -> float:
+    """Return the coefficient of VIFCode according to `value` byte.
+
+    Notes
+    -----
+    The narrow counterpart of `get_code` for the callers
+    that scale measured values and need no kind or unit.
+
+    Parameters
+    ----------
+    value : int | VIF
+        a byte value that can match a certain VIF code
+    extension_byte : None | int | VIFE, default None
+        get a coefficient from an extended table
+        according to `extension_byte` value
+
+    Raises
+    ------
+    MBusValidationError
+        if `value` is not within the byte range
+    ValueError
+        if extension code is invalid
+
+    Returns
+    -------
+    float
+        NaN if there is no VIF code for `value`
+    """
+    coefs = _select_coefs(extension_byte)
+    return coefs[validate_byte(int(value))]
+
+
+def get_coefs(
+    values: Iterable[int | VIF | VIFE],
+    *,
+    extension_byte: None | int | VIF = None,
+) -> list[float]:
+    """Return the coefficients of VIFCodes according to `values` bytes.
+
+    Notes
+    -----
+    The bulk counterpart of `get_coef`:
+    the bytes are validated at once and looked up in a single pass.
+
+    Parameters
+    ----------
+    values : Iterable[int | VIF | VIFE]
+        byte values that can match certain VIF codes
+    extension_byte : None | int | VIFE, default None
+        get coefficients from an extended table
+        according to `extension_byte` value
+
+    Raises
+    ------
+    MBusValidationError
+        if `values` is not an iterable of bytes
+    ValueError
+        if extension code is invalid
+
+    Returns
+    -------
+    list[float]
+        NaN for the values without a VIF code
+    """
+    coefs = _select_coefs(extension_byte)
+    # bytes(n) would make n zero bytes out of a single integer
+    if isinstance(values, int):
+        msg = f"{values} is not an iterable of bytes"
+        raise MBusValidationError(msg)
+    try:
+        bytez = bytes(values)
+    except (TypeError, ValueError) as e:
+        msg = f"invalid VIF bytes {values!r}: {e}"
+        raise MBusValidationError(msg) from e
+    return list(map(coefs.__getitem__, bytez))
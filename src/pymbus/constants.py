@@ -1,9 +1,9 @@
 """Meter-Bus (M-Bus) constants."""
 
-from typing import Literal
+from typing import Final
 
-BYTE: int = 8
-NIBBLE: int = 4
+BYTE: Final[int] = 8
+NIBBLE: Final[int] = 4
 
-BIG_ENDIAN: Literal["big"] = "big"
-LITTLE_ENDIAN: Literal["little"] = "little"
+BIG_ENDIAN: Final = "big"
+LITTLE_ENDIAN: Final = "little"
@@ -42,11 +42,11 @@ Type G, or Compound CP16: Date -> 2 bytes.
 
 import struct
 from collections.abc import Iterable
-from contextlib import suppress
 from datetime import date, datetime, time, timezone, tzinfo
+from itertools import islice
 from typing import Literal
 
-from pymbus.constants import BIG_ENDIAN, NIBBLE
+from pymbus.constants import BIG_ENDIAN, LITTLE_ENDIAN, NIBBLE
 from pymbus.exceptions import MBusError, MBusLengthError
 
 BytesType = bytes | bytearray | Iterable[int]
@@ -56,11 +56,51 @@ BytesType = bytes | bytearray | Iterable[int]
 
 
 def _validate_non_empty_bytes(ibytes: BytesType) -> bytes:
-    ibytes = bytes(list(ibytes))
-    if not ibytes:
+    if isinstance(ibytes, int):
+        msg = f"{ibytes} is not an iterable of bytes"
+        raise TypeError(msg)
+    bytez = bytes(ibytes)
+    if not bytez:
         msg = "cannot parse empty bytes"
         raise MBusLengthError(msg)
-    return ibytes
+    return bytez
+
+
+def _take_bytes(ibytes: BytesType, min_size: int, max_size: int) -> bytes:
+    """Return from `min_size` to `max_size` leading bytes of `ibytes`.
+
+    The rest of `ibytes` is neither consumed nor validated.
+    """
+    if isinstance(ibytes, bytes | bytearray):
+        bytez = bytes(ibytes[:max_size])
+    else:
+        bytez = bytes(islice(ibytes, max_size))
+    if len(bytez) < min_size:
+        raise MBusLengthError(str(ibytes))
+    return bytez
+
+
+# the masks of BCD digits in a 64-bit word: the lower halves of
+# the 8-bit, 16-bit, 32-bit and 64-bit lanes respectively
+_BCD_NIBBLES_MASK = 0x0F0F_0F0F_0F0F_0F0F
+_BCD_BYTES_MASK = 0x00FF_00FF_00FF_00FF
+_BCD_WORDS_MASK = 0x0000_FFFF_0000_FFFF
+_BCD_DWORDS_MASK = 0x0000_0000_FFFF_FFFF
+_BCD_WORD_SIZE = 8  # bytes
+_BCD_WORD_SCALE = 10**16  # 16 BCD digits per word
+
+
+def _parse_bcd_word(word: int) -> int:
+    """Return the number of the 16 BCD digits of a 64-bit `word`.
+
+    The nibbles are decoded in parallel (SWAR):
+    the adjacent lanes are merged pairwise, the higher lane
+    is scaled by 10, 100, 10_000 and 10**8 respectively.
+    """
+    word = (word & _BCD_NIBBLES_MASK) + ((word >> 4) & _BCD_NIBBLES_MASK) * 10
+    word = (word & _BCD_BYTES_MASK) + ((word >> 8) & _BCD_BYTES_MASK) * 100
+    word = (word & _BCD_WORDS_MASK) + ((word >> 16) & _BCD_WORDS_MASK) * 10_000
+    return (word & _BCD_DWORDS_MASK) + (word >> 32) * 100_000_000
 
 
 def parse_bcd_uint(ibytes: BytesType) -> int:
@@ -68,7 +108,9 @@ def parse_bcd_uint(ibytes: BytesType) -> int:
 
     BCD = Binary-Coded Decimal.
     The "Unsigned Integer BCD" type = "Type A".
-    The bytes are parsed along the Big endian order.
+    The bytes are parsed along the Little endian order:
+    the first byte holds the least significant digits and
+    the low nibble of a byte is the less significant one.
 
     The function is greedy.
 
@@ -88,15 +130,16 @@ def parse_bcd_uint(ibytes: BytesType) -> int:
     """
     bytez = _validate_non_empty_bytes(ibytes)
 
-    msp, lsp = 0b1111_0000, 0b0000_1111
-    masks = (lsp, msp)
+    # zero padding to whole words adds the leading zero digits
+    bytez += bytes(-len(bytez) % _BCD_WORD_SIZE)
 
-    number, power = 0, 0
-    for byte in bytez:
-        for mask in masks:
-            digit = byte & mask
-            number += digit * 10**power
-            power += 1
+    number = 0
+    # from the most significant word down to the least one
+    for start in range(len(bytez) - _BCD_WORD_SIZE, -1, -_BCD_WORD_SIZE):
+        word = int.from_bytes(
+            bytez[start : start + _BCD_WORD_SIZE], byteorder=LITTLE_ENDIAN
+        )
+        number = number * _BCD_WORD_SCALE + _parse_bcd_word(word)
 
     return number
 
@@ -131,7 +174,7 @@ def parse_int(
     """
     bytez = _validate_non_empty_bytes(ibytes)
 
-    return int.from_bytes(bytes(bytez), byteorder=byteorder, signed=True)
+    return int.from_bytes(bytez, byteorder=byteorder, signed=True)
 
 
 def parse_uint(
@@ -164,7 +207,7 @@ def parse_uint(
     """
     bytez = _validate_non_empty_bytes(ibytes)
 
-    return int.from_bytes(bytes(bytez), byteorder=byteorder, signed=False)
+    return int.from_bytes(bytez, byteorder=byteorder, signed=False)
 
 
 ## boolean section
@@ -200,6 +243,10 @@ def parse_bool(
 ## floating point (real) numbers section
 
 
+# Type H is transmitted as the little endian IEEE 754 single precision
+_FLOAT_STRUCT = struct.Struct("<f")
+
+
 def parse_float(ibytes: BytesType) -> float:
     """Returns the float from a byte sequence.
 
@@ -221,18 +268,15 @@ def parse_float(ibytes: BytesType) -> float:
     -------
     float
     """
-    it = iter(ibytes)
-    try:
-        frame = [next(it) for _ in range(4)]
-    except StopIteration as e:
-        raise MBusLengthError(str(ibytes)) from e
-
+    size = _FLOAT_STRUCT.size
     try:
-        return float(struct.unpack("f", bytes(frame))[0])
-    except (struct.error, ValueError) as e:
-        msg = f"float parsing error for {frame}: {e}"
+        frame = _take_bytes(ibytes, size, size)
+    except ValueError as e:
+        msg = f"float parsing error for {ibytes!r}: {e}"
         raise MBusError(msg) from e
 
+    return float(_FLOAT_STRUCT.unpack(frame)[0])
+
 
 ## types and units information (Type E = Compound CP16)
 
@@ -252,13 +296,7 @@ class UnitType:
         return cls.from_bytes(barr)
 
     def __init__(self, ibytes: BytesType) -> None:
-        it = iter(ibytes)
-        try:
-            lst = [next(it) for _ in range(2)]
-        except StopIteration as e:
-            raise MBusLengthError(str(ibytes)) from e
-
-        fields = bytes(lst)
+        fields = _take_bytes(ibytes, 2, 2)
 
         unit_mask, media_mask = 0b1100_0000, 0b0011_1111
         self._unit1 = fields[1] & unit_mask
@@ -368,13 +406,7 @@ def parse_date(ibytes: BytesType) -> date:
     -------
     date
     """
-    it = iter(ibytes)
-    try:
-        lst = [next(it) for _ in range(2)]
-    except StopIteration as e:
-        raise MBusLengthError(str(ibytes)) from e
-
-    fields = bytes(lst)
+    fields = _take_bytes(ibytes, 2, 2)
 
     dt0 = fields[0]
     dt1 = fields[1]
@@ -465,32 +497,22 @@ def parse_time(ibytes: BytesType) -> time:
     ibytes: BytesType
         a byte sequence for time parsing
 
+    Raises
+    ------
+    MBusLengthError
+
     Returns
     -------
     time
     """
-    it = iter(ibytes)
-    lst = [next(it) for _ in range(2)]
-
-    sec_byte: None | int = None
-    try:
-        sec_byte = next(it)
-        next(it)
-        sec_byte = next(it)
-    except StopIteration:
-        pass
-
-    if sec_byte:
-        lst += [sec_byte]
-
-    fields = bytes(lst)
+    fields = _take_bytes(ibytes, 2, 5)
 
     dt0 = fields[0]
     dt1 = fields[1]
     sec_byte = 0
 
     length = len(fields)
-    if length == 3:
+    if length in (3, 4):
         sec_byte = fields[2]
     if length == 5:
         sec_byte = fields[4]
@@ -586,16 +608,7 @@ def parse_datetime(ibytes: BytesType) -> datetime:
     -------
     datetime
     """
-    it = iter(ibytes)
-    try:
-        lst = [next(it) for _ in range(4)]
-    except StopIteration as e:
-        raise MBusLengthError(str(ibytes)) from e
-
-    with suppress(StopIteration):
-        lst += [next(it)]
-
-    fields = bytes(lst)
+    fields = _take_bytes(ibytes, 4, 5)
 
     dt0 = fields[0]
     dt1 = fields[1]
@@ -1,10 +1,21 @@
+import math
+import pickle
+from collections.abc import Mapping
+
 import pytest
 
 from pymbus.codes.vif import (
+    VIF_CODE_FB_EXTENSION_MAP,
+    VIF_CODE_FD_EXTENSION_MAP,
+    VIF_CODE_MAP,
     VIFCode,
     VIFCodeKind,
     VIFCodeUnit,
     get_code,
+    get_coef,
+    get_coefs,
+    get_kind,
+    get_unit,
 )
 from pymbus.exceptions import MBusValidationError
 from pymbus.telegrams.fields import ValueInformationField as VIF
@@ -44,6 +55,95 @@ def test_wrong_extension_bit_value():
         get_code(VIF(0), extension_byte=-1)
 
 
+@pytest.mark.parametrize("extension_byte", [None, 0xFB, 0xFD])
+def test_vif_code_coefs(extension_byte: None | int):
+    for value in range(256):
+        code = get_code(value, extension_byte=extension_byte)
+        coef = get_coef(value, extension_byte=extension_byte)
+        if code is None:
+            assert math.isnan(coef)
+        else:
+            assert coef == code.coef
+
+
+@pytest.mark.parametrize("extension_byte", [None, 0xFB, 0xFD])
+def test_vif_code_bulk_coefs(extension_byte: None | int):
+    values = [VIF(value) for value in range(256)]
+    coefs = get_coefs(values, extension_byte=extension_byte)
+
+    assert len(coefs) == len(values)
+    for value, coef in zip(values, coefs, strict=True):
+        answer = get_coef(value, extension_byte=extension_byte)
+        assert coef == answer or (math.isnan(coef) and math.isnan(answer))
+    assert get_coefs(b"", extension_byte=extension_byte) == []
+
+
+def test_vif_code_coef_errors():
+    with pytest.raises(MBusValidationError):
+        get_coef(266)
+    with pytest.raises(ValueError, match="wrong extension_byte"):
+        get_coef(VIF(0), extension_byte=-1)
+    with pytest.raises(MBusValidationError):
+        get_coefs([0, 266])
+    with pytest.raises(MBusValidationError, match="not an iterable"):
+        get_coefs(3)  # type: ignore[arg-type]
+    with pytest.raises(MBusValidationError, match="invalid VIF bytes"):
+        get_coefs("ab")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="wrong extension_byte"):
+        get_coefs(b"\x00", extension_byte=-1)
+
+
+def test_vif_code_identity():
+    codes: dict[VIFCode, VIFCode] = {}
+    for mapping in (
+        VIF_CODE_MAP,
+        VIF_CODE_FB_EXTENSION_MAP,
+        VIF_CODE_FD_EXTENSION_MAP,
+    ):
+        for code in mapping.values():
+            assert codes.setdefault(code, code) is code
+
+
+def test_vif_code_kinds_and_units():
+    for kind in VIFCodeKind:
+        assert get_kind(kind.value) is kind
+    for unit in VIFCodeUnit:
+        assert get_unit(unit.value) is unit
+    assert get_kind("no such kind") is None
+    assert get_unit("no such unit") is None
+
+
+def test_vif_code_immutability():
+    code = get_code(0)
+    assert code is not None
+
+    with pytest.raises(AttributeError):
+        code.coef = 1  # type: ignore[misc]
+    assert hash(code) == hash(VIFCode(*code))
+    assert pickle.loads(pickle.dumps(code)) == code
+
+
+@pytest.mark.parametrize(
+    ("mapping", "extension_byte"),
+    [
+        (VIF_CODE_MAP, None),
+        (VIF_CODE_FB_EXTENSION_MAP, 0xFB),
+        (VIF_CODE_FD_EXTENSION_MAP, 0xFD),
+    ],
+)
+def test_vif_code_maps(mapping: Mapping, extension_byte: None | int):
+    with pytest.raises(TypeError):
+        mapping[0] = VIFCode()  # type: ignore[index]
+
+    assert list(mapping) == sorted(mapping)
+
+    for byte, code in mapping.items():
+        assert get_code(byte, extension_byte=extension_byte) == code
+        assert type(code.coef) is float
+        assert type(code.kind) is str
+        assert type(code.unit) is str
+
+
 @pytest.mark.parametrize(
     ("vif", "coef", "kind", "unit"),
     [
@@ -149,6 +149,14 @@ def test_time_init(
             "3B 17 FF FF 3B",
             time(hour=23, minute=59, second=59),
         ),
+        (
+            "3B 17 3B FF",
+            time(hour=23, minute=59, second=59),
+        ),
+        (
+            "3B 17 FF FF 3B FF",
+            time(hour=23, minute=59, second=59),
+        ),
     ],
 )
 def test_parse_time(hexdata: str, tt: time):
@@ -161,6 +169,12 @@ def test_parse_time(hexdata: str, tt: time):
     assert parse_time(integers) == tt
 
 
+@pytest.mark.parametrize("it", [[], [0x3B], b"\x3b"])
+def test_parse_time_short(it: list[int] | bytes):
+    with pytest.raises(MBusError):
+        parse_time(it)
+
+
 def test_time_repr():
     hour, minute, second = 23, 59, 59
 
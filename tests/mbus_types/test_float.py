@@ -14,6 +14,11 @@ from pymbus.mbtypes import parse_float
         ([0, 0, 0], 0.0, pytest.raises(MBusError)),
         ([0, 0, 0, 0], 0.0, does_not_raise()),
         ([-1, 0, 0, 0], 0.0, pytest.raises(MBusError)),
+        ([0, 0, 0x80, 0x3F], 1.0, does_not_raise()),
+        ([0, 0, 0x80, 0x3F, 0xFF], 1.0, does_not_raise()),
+        (bytes([0, 0, 0x20, 0xC1]), -10.0, does_not_raise()),
+        (bytearray([0, 0, 0x80, 0x3F, 0xFF]), 1.0, does_not_raise()),
+        (bytes([0, 0, 0]), 0.0, pytest.raises(MBusError)),
     ],
 )
 def test_parse_float(
@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from math import isclose
 from typing import Literal
 
@@ -7,6 +7,7 @@ import pytest
 from pymbus.constants import BIG_ENDIAN, LITTLE_ENDIAN
 from pymbus.exceptions import MBusError
 from pymbus.mbtypes import (
+    parse_bcd_uint,
     parse_int,
     parse_uint,
 )
@@ -99,6 +100,35 @@ class TestParseUint:
             parse_uint(bytes([]))
 
 
+class TestParseBcdUint:
+    @pytest.mark.parametrize(
+        ("it", "answer"),
+        [
+            ([0x00], 0),
+            ([0x12], 12),
+            ([0x99], 99),
+            ([0x34, 0x12], 1234),
+            ([0x78, 0x56, 0x34, 0x12], 12_345_678),
+            ([0x99] * 8, 10**16 - 1),
+            ([0x99] * 9, 10**18 - 1),
+            ([0x00] * 8 + [0x01], 10**16),
+            ([0x01] + [0x00] * 9, 1),
+        ],
+    )
+    def test_parse_bcd_uint(self, it: Iterable, answer: int):
+        assert parse_bcd_uint(bytes(it)) == answer
+
+    def test_parse_bcd_uint_empty(self):
+        with pytest.raises(MBusError):
+            parse_bcd_uint(bytes([]))
+
+
+@pytest.mark.parametrize("parse", [parse_int, parse_uint, parse_bcd_uint])
+def test_parse_integer_argument(parse: Callable[[Iterable[int]], int]):
+    with pytest.raises(TypeError):
+        parse(3)  # type: ignore[arg-type]
+
+
 @pytest.mark.parametrize(
     ("data", "answer"),
     [